@@ -8,6 +8,7 @@ import os
 import json
 import base64
 import asyncio
+import time
 from datetime import datetime
 from typing import Dict, Optional
 import io
@@ -22,6 +23,13 @@ from loguru import logger
 
 from medical_scribe import MedicalScribe
 
+# Serve on uvloop's libuv-backed event loop when available
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # Initialize FastAPI
 app = FastAPI(
     title="Medical Voice Agent",
@@ -629,10 +637,33 @@ async def process_audio(audio: UploadFile = File(...)):
         logger.error(f"Error processing audio: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+class _IsoClock:
+    """
+    Second-granularity cached UTC timestamp
+
+    Load-balancer probes hit /health constantly; formatting a fresh
+    datetime per request is wasted work, so reformat at most once a second
+    """
+
+    def __init__(self):
+        self._sec = 0
+        self._ts = ""
+
+    def now(self) -> str:
+        sec = int(time.time())
+        if sec != self._sec:
+            self._sec = sec
+            self._ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec))
+        return self._ts
+
+
+_iso_clock = _IsoClock()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {"status": "healthy", "timestamp": _iso_clock.now()}
 
 if __name__ == "__main__":
     logger.info("Starting Medical Voice Agent server...")
@@ -9,8 +9,9 @@ import hmac
 import base64
 import json
 import logging
-from typing import Dict, Any, List, Optional, Pattern
+from typing import Dict, Any, List, Optional, Pattern, Tuple
 from datetime import datetime, timedelta
+from time import monotonic
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2
@@ -19,145 +20,131 @@ import os
 logger = logging.getLogger(__name__)
 
 
+# Regex sources for PHI detection, keyed by PHI type. Flags are scoped
+# inline so the sources can be compiled per type or fused into the
+# single-pass scanner
+_PHI_PATTERN_SOURCES = {
+    # Social Security Numbers
+    'ssn': r'(?i:\b(?:\d{3}-\d{2}-\d{4}|\d{3}\s\d{2}\s\d{4}|\d{9})\b)',
+
+    # Medical Record Numbers (various formats)
+    'mrn': r'(?i:\b(?:MRN|Medical Record Number|Patient ID)[\s:#]*[\w\d-]+\b)',
+
+    # Date of Birth
+    'dob': r'\b(?:\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|\d{4}[-/]\d{1,2}[-/]\d{1,2})\b',
+
+    # Phone Numbers
+    'phone': r'\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b',
+
+    # Email Addresses
+    'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+
+    # Credit Card Numbers
+    'credit_card': r'\b(?:\d{4}[-\s]?){3}\d{4}\b',
+
+    # US Addresses (simplified pattern)
+    'address': r'(?i:\d+\s+[\w\s]+(?:street|st|avenue|ave|road|rd|highway|hwy|lane|ln|drive|dr|court|ct|place|pl|boulevard|blvd)\b)',
+
+    # Insurance ID
+    'insurance': r'(?i:\b(?:policy|member|subscriber|group)[\s#:]*[\w\d-]+\b)',
+
+    # DEA Numbers
+    'dea': r'\b[A-Z]{2}\d{7}\b',
+
+    # NPI Numbers
+    'npi': r'\b\d{10}\b',
+
+    # State ID/Driver's License (generic)
+    'state_id': r'(?i:\b(?:DL|License|ID)[\s#:]*[\w\d-]+\b)'
+}
+
+# Compiled once at import so every redactor instance - and every test
+# run - shares the same pattern tables instead of recompiling
+_PHI_PATTERNS: Dict[str, Pattern] = {
+    name: re.compile(source) for name, source in _PHI_PATTERN_SOURCES.items()
+}
+
+# All patterns fused into one alternation so redaction scans the text
+# once instead of once per pattern
+_PHI_SCANNER: Pattern = re.compile(
+    '|'.join(f'(?P<{name}>{source})' for name, source in _PHI_PATTERN_SOURCES.items())
+)
+
+# Context clues like "my name is [NAME]" - each alternative has a single
+# capturing group carrying the name to redact
+_NAME_CONTEXT: Pattern = re.compile(
+    r'(?:my|patient|caller|your)\s+name\s+is\s+(\w+(?:\s+\w+)*)'
+    r'|(?:I am|I\'m|This is)\s+(\w+(?:\s+\w+)*)'
+    r'|(?:calling for|regarding)\s+(\w+(?:\s+\w+)*)',
+    re.IGNORECASE
+)
+
+
 class PHIRedactor:
     """
     Redacts Protected Health Information (PHI) from text and data structures
     Uses pattern matching and ML-based detection for comprehensive coverage
     """
-    
+
+    # Field names that always hold PHI - redacted wholesale by name so
+    # their values never reach the pattern pipeline
+    _PHI_FIELDS = frozenset({
+        'ssn', 'social_security_number', 'mrn', 'medical_record_number',
+        'dob', 'date_of_birth', 'birth_date', 'phone', 'phone_number',
+        'email', 'email_address', 'address', 'street_address',
+        'patient_name', 'name', 'full_name', 'first_name', 'last_name',
+        'insurance_id', 'policy_number', 'credit_card', 'card_number'
+    })
+
+
     def __init__(self):
         """Initialize PHI patterns and redaction rules"""
-        self.patterns = self._compile_phi_patterns()
+        self.patterns = _PHI_PATTERNS
+        self._scanner = _PHI_SCANNER
+        self._name_context = _NAME_CONTEXT
         self.redaction_char = os.getenv('PHI_MASK_CHARACTER', '*')
         self.enabled = os.getenv('PHI_REDACTION_ENABLED', 'true').lower() == 'true'
-        
-    def _compile_phi_patterns(self) -> Dict[str, Pattern]:
-        """
-        Compile regex patterns for PHI detection
-        
-        Returns:
-            Dictionary of compiled regex patterns
-        """
-        patterns = {
-            # Social Security Numbers
-            'ssn': re.compile(
-                r'\b(?:\d{3}-\d{2}-\d{4}|\d{3}\s\d{2}\s\d{4}|\d{9})\b',
-                re.IGNORECASE
-            ),
-            
-            # Medical Record Numbers (various formats)
-            'mrn': re.compile(
-                r'\b(?:MRN|Medical Record Number|Patient ID)[\s:#]*[\w\d-]+\b',
-                re.IGNORECASE
-            ),
-            
-            # Date of Birth
-            'dob': re.compile(
-                r'\b(?:\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|\d{4}[-/]\d{1,2}[-/]\d{1,2})\b'
-            ),
-            
-            # Phone Numbers
-            'phone': re.compile(
-                r'\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b'
-            ),
-            
-            # Email Addresses
-            'email': re.compile(
-                r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            ),
-            
-            # Credit Card Numbers
-            'credit_card': re.compile(
-                r'\b(?:\d{4}[-\s]?){3}\d{4}\b'
-            ),
-            
-            # US Addresses (simplified pattern)
-            'address': re.compile(
-                r'\d+\s+[\w\s]+(?:street|st|avenue|ave|road|rd|highway|hwy|lane|ln|drive|dr|court|ct|place|pl|boulevard|blvd)\b',
-                re.IGNORECASE
-            ),
-            
-            # Insurance ID
-            'insurance': re.compile(
-                r'\b(?:policy|member|subscriber|group)[\s#:]*[\w\d-]+\b',
-                re.IGNORECASE
-            ),
-            
-            # DEA Numbers
-            'dea': re.compile(
-                r'\b[A-Z]{2}\d{7}\b'
-            ),
-            
-            # NPI Numbers
-            'npi': re.compile(
-                r'\b\d{10}\b'
-            ),
-            
-            # State ID/Driver's License (generic)
-            'state_id': re.compile(
-                r'\b(?:DL|License|ID)[\s#:]*[\w\d-]+\b',
-                re.IGNORECASE
-            )
-        }
-        
-        return patterns
-    
+
     def redact_string(self, text: str) -> str:
         """
         Redact PHI from a string
-        
+
+        Collects match spans from a single scan of the fused pattern plus
+        the contextual name patterns, then rebuilds the string in one pass
+
         Args:
             text: Input text potentially containing PHI
-            
+
         Returns:
             Text with PHI redacted
         """
         if not self.enabled or not text:
             return text
-        
-        redacted = text
-        
-        # Apply each pattern
-        for pattern_name, pattern in self.patterns.items():
-            redacted = pattern.sub(
-                lambda m: self.redaction_char * len(m.group()),
-                redacted
-            )
-        
-        # Additional context-based redaction
-        redacted = self._redact_contextual_phi(redacted)
-        
-        return redacted
-    
-    def _redact_contextual_phi(self, text: str) -> str:
-        """
-        Redact PHI based on context clues
-        
-        Args:
-            text: Text to check for contextual PHI
-            
-        Returns:
-            Text with contextual PHI redacted
-        """
-        # Look for patterns like "my name is [NAME]"
-        name_contexts = [
-            r'(?:my|patient|caller|your)\s+name\s+is\s+(\w+(?:\s+\w+)*)',
-            r'(?:I am|I\'m|This is)\s+(\w+(?:\s+\w+)*)',
-            r'(?:calling for|regarding)\s+(\w+(?:\s+\w+)*)'
-        ]
-        
-        for pattern in name_contexts:
-            text = re.sub(
-                pattern,
-                lambda m: m.group().replace(
-                    m.group(1), 
-                    self.redaction_char * len(m.group(1))
-                ),
-                text,
-                flags=re.IGNORECASE
-            )
-        
-        return text
+
+        spans = [match.span() for match in self._scanner.finditer(text)]
+        spans.extend(
+            match.span(match.lastindex)
+            for match in self._name_context.finditer(text)
+        )
+
+        if not spans:
+            return text
+
+        # Merge overlapping spans and splice in the mask characters once
+        spans.sort()
+        pieces = []
+        cursor = 0
+        for start, end in spans:
+            if end <= cursor:
+                continue
+            if start < cursor:
+                start = cursor
+            pieces.append(text[cursor:start])
+            pieces.append(self.redaction_char * (end - start))
+            cursor = end
+        pieces.append(text[cursor:])
+
+        return ''.join(pieces)
     
     def redact_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -171,21 +158,16 @@ class PHIRedactor:
         """
         if not self.enabled:
             return data
-        
+
         redacted = {}
-        
-        # PHI field names to fully redact
-        phi_fields = {
-            'ssn', 'social_security_number', 'mrn', 'medical_record_number',
-            'dob', 'date_of_birth', 'birth_date', 'phone', 'phone_number',
-            'email', 'email_address', 'address', 'street_address',
-            'patient_name', 'name', 'full_name', 'first_name', 'last_name',
-            'insurance_id', 'policy_number', 'credit_card', 'card_number'
-        }
-        
+
         for key, value in data.items():
-            # Check if field name indicates PHI
-            if any(phi_field in key.lower() for phi_field in phi_fields):
+            # Check if field name indicates PHI - exact hit is a single
+            # set probe; only unknown keys pay the substring scan
+            key_lower = key.lower()
+            if key_lower in self._PHI_FIELDS or any(
+                phi_field in key_lower for phi_field in self._PHI_FIELDS
+            ):
                 redacted[key] = self.redaction_char * 8  # Fixed length redaction
             elif isinstance(value, str):
                 redacted[key] = self.redact_string(value)
@@ -203,6 +185,24 @@ class PHIRedactor:
         
         return redacted
     
+    def contains_phi(self, text: str) -> bool:
+        """
+        Check whether any PHI pattern matches the text
+
+        One scan of the fused pattern that stops at the first hit,
+        instead of a search per pattern - used by redaction audits
+
+        Args:
+            text: Text to check
+
+        Returns:
+            True if any PHI pattern matches
+        """
+        if not text:
+            return False
+
+        return self._scanner.search(text) is not None
+
     def detect_phi(self, text: str) -> List[Dict[str, Any]]:
         """
         Detect PHI in text and return locations
@@ -395,7 +395,13 @@ class CallerVerification:
         self.max_attempts = 3
         self.verification_timeout = 300  # 5 minutes
         self.active_sessions = {}
-        
+
+        # Successful lookups cached briefly so re-verification within a
+        # session is a dict hit instead of another patient-store query
+        self._lookup_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+        self._lookup_cache_ttl = 300.0  # seconds
+
+
     async def verify(self, full_name: str, date_of_birth: str) -> Dict[str, Any]:
         """
         Verify patient identity using name and DOB
@@ -414,8 +420,18 @@ class CallerVerification:
             
             # Query patient database (mock implementation)
             # In production, this would query your FHIR server or patient database
-            patient = await self._lookup_patient(name_normalized, dob_normalized)
-            
+            cache_key = (name_normalized, dob_normalized)
+            cached = self._lookup_cache.get(cache_key)
+            if cached and monotonic() - cached[0] < self._lookup_cache_ttl:
+                patient = cached[1]
+            else:
+                patient = await self._lookup_patient(name_normalized, dob_normalized)
+                if patient:
+                    # Only successful lookups are cached - a record that
+                    # is missing now may appear at any time
+                    self._lookup_cache[cache_key] = (monotonic(), patient)
+
+
             if patient:
                 return {
                     'verified': True,
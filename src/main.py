@@ -7,6 +7,15 @@ import os
 import logging
 import json
 import asyncio
+
+# orjson decodes the per-frame Twilio Media Streams JSON with a C core;
+# fall back to the stdlib codec when it isn't installed
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 from typing import Dict, Any, Optional
 from datetime import datetime
 import hashlib
@@ -335,7 +344,7 @@ async def websocket_endpoint(websocket: WebSocket, call_sid: str):
         # Handle incoming messages
         while True:
             message = await websocket.receive_text()
-            data = json.loads(message)
+            data = _loads(message)
             
             event_type = data.get('event')
             
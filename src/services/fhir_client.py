@@ -147,17 +147,17 @@ class FHIRClient:
         
         return headers
     
-    async def _request(self, method: str, endpoint: str, 
+    async def _request(self, method: str, endpoint: str,
                       data: Optional[Dict] = None,
-                      params: Optional[Dict] = None) -> Dict[str, Any]:
+                      params: Optional[Any] = None) -> Dict[str, Any]:
         """
         Make FHIR API request with retry logic
-        
+
         Args:
             method: HTTP method
             endpoint: API endpoint
             data: Request body
-            params: Query parameters
+            params: Query parameters (dict or list of (name, value) tuples)
             
         Returns:
             Response data
@@ -305,21 +305,39 @@ class FHIRClient:
         endpoint = f"Appointment/{appointment_id}"
         return await self._request('GET', endpoint)
     
-    async def search_appointments(self, **kwargs) -> Dict[str, Any]:
+    async def search_appointments(self, params: Optional[List[tuple]] = None,
+                                 **kwargs) -> Dict[str, Any]:
         """
         Search appointments
-        
+
         Args:
+            params: Search parameters as (name, value) tuples, for
+                   parameters that repeat (e.g. date range bounds)
             **kwargs: Search parameters (patient, date, status, etc.)
-            
+
         Returns:
             Bundle of appointment resources
         """
         endpoint = "Appointment"
-        params = {k: v for k, v in kwargs.items() if v is not None}
+        if params is None:
+            params = [(k, v) for k, v in kwargs.items() if v is not None]
         return await self._request('GET', endpoint, params=params)
     
-    async def update_appointment_status(self, appointment_id: str, 
+    async def get_appointments_bulk(self, appointment_ids: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve multiple appointments in a single search
+
+        Args:
+            appointment_ids: Appointment identifiers
+
+        Returns:
+            Bundle of appointment resources
+        """
+        endpoint = "Appointment"
+        params = {'_id': ','.join(appointment_ids)}
+        return await self._request('GET', endpoint, params=params)
+
+    async def update_appointment_status(self, appointment_id: str,
                                        status: str) -> Dict[str, Any]:
         """
         Update appointment status
@@ -438,19 +456,25 @@ class FHIRClient:
     
     # ===== Observation Resources (for lab results) =====
     
-    async def get_observations(self, patient_id: str, 
+    async def get_observations(self, patient_id: str,
                               category: Optional[str] = None,
                               code: Optional[str] = None,
-                              date: Optional[str] = None) -> Dict[str, Any]:
+                              date: Optional[str] = None,
+                              count: Optional[int] = None,
+                              sort: Optional[str] = None,
+                              elements: Optional[str] = None) -> Dict[str, Any]:
         """
         Get observations (lab results, vitals) for a patient
-        
+
         Args:
             patient_id: Patient identifier
             category: Category filter (laboratory, vital-signs, etc.)
             code: LOINC code filter
             date: Date filter
-            
+            count: Page size limit (_count)
+            sort: Sort order (_sort, e.g. '-date' for newest first)
+            elements: Comma-separated fields to project (_elements)
+
         Returns:
             Bundle of observation resources
         """
@@ -459,7 +483,10 @@ class FHIRClient:
             'subject': f"Patient/{patient_id}",
             'category': category,
             'code': code,
-            'date': date
+            'date': date,
+            '_count': count,
+            '_sort': sort,
+            '_elements': elements
         }
         params = {k: v for k, v in params.items() if v is not None}
         return await self._request('GET', endpoint, params=params)
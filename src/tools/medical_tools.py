@@ -3,9 +3,13 @@ Medical Tools for Voice Agent
 HIPAA-compliant tools for handling medical office operations
 """
 
+import asyncio
 import logging
+import os
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta, time
+from datetime import datetime, date, timedelta, time
+from time import monotonic
+from types import MappingProxyType
 import re
 import pytz
 from dataclasses import dataclass
@@ -15,8 +19,20 @@ from src.core.security import PHIRedactor, AuditLogger
 
 logger = logging.getLogger(__name__)
 
+# Shared across MedicalTools instances - PHIRedactor compiles its pattern
+# set at construction and AuditLogger sets up encryption, neither of
+# which needs repeating per instance
+_PHI_REDACTOR = PHIRedactor()
+_AUDIT_LOGGER = AuditLogger()
 
-@dataclass
+# FHIR reference builders - bound str.format parses the template once
+# instead of on every reference built
+_PATIENT_REF = 'Patient/{}'.format
+_PRACTITIONER_REF = 'Practitioner/{}'.format
+_MEDREQUEST_REF = 'MedicationRequest/{}'.format
+
+
+@dataclass(slots=True)
 class AppointmentSlot:
     """Available appointment slot"""
     date: str
@@ -32,6 +48,12 @@ class MedicalTools:
     Medical office tools for the voice agent
     All tools ensure HIPAA compliance and proper audit trails
     """
+
+    # Audit event names - interned constants instead of per-call literals
+    _EVT_BOOKED = 'appointment_booked'
+    _EVT_CANCELLED = 'appointment_cancelled'
+    _EVT_REFILL = 'refill_requested'
+    _EVT_MESSAGE = 'provider_message_created'
     
     def __init__(self, fhir_client: FHIRClient):
         """
@@ -41,8 +63,8 @@ class MedicalTools:
             fhir_client: FHIR client instance
         """
         self.fhir = fhir_client
-        self.phi_redactor = PHIRedactor()
-        self.audit_logger = AuditLogger()
+        self.phi_redactor = _PHI_REDACTOR
+        self.audit_logger = _AUDIT_LOGGER
         
         # Business configuration
         self.business_hours = {
@@ -62,9 +84,95 @@ class MedicalTools:
         
         # Timezone configuration
         self.timezone = pytz.timezone(os.getenv('BUSINESS_TIMEZONE', 'America/New_York'))
-        
+
+        # Precompute the 30-minute slot grid for the business day once,
+        # so slot searches don't rebuild datetime objects on every call
+        self._slot_times: List[time] = []
+        self._slot_strs: List[str] = []
+        slot_cursor = datetime.combine(datetime.min, self.business_hours['start'])
+        slot_end = datetime.combine(datetime.min, self.business_hours['end'])
+        while slot_cursor < slot_end:
+            self._slot_times.append(slot_cursor.time())
+            self._slot_strs.append(slot_cursor.strftime('%H:%M'))
+            slot_cursor += timedelta(minutes=30)
+
+        # Office information never changes at runtime - resolve the env
+        # lookups once and serve a read-only mapping
+        self._info_map = MappingProxyType({
+            'hours': {
+                'monday_friday': '8:00 AM - 5:00 PM',
+                'saturday': 'Closed',
+                'sunday': 'Closed',
+                'holidays': 'Closed on major holidays'
+            },
+            'location': {
+                'address': os.getenv('OFFICE_ADDRESS', '123 Medical Center Dr'),
+                'city': os.getenv('OFFICE_CITY', 'Louisville'),
+                'state': 'KY',
+                'zip': os.getenv('OFFICE_ZIP', '40202'),
+                'phone': os.getenv('OFFICE_PHONE', '502-555-0100')
+            },
+            'services': [
+                'Primary Care',
+                'Annual Physicals',
+                'Preventive Care',
+                'Chronic Disease Management',
+                'Minor Procedures',
+                'Lab Services',
+                'Telehealth Visits'
+            ],
+            'insurance': [
+                'Medicare',
+                'Medicaid',
+                'Most major insurance plans',
+                'Please call to verify specific coverage'
+            ],
+            'emergency': {
+                'message': 'For medical emergencies, hang up and dial 911',
+                'after_hours': 'For urgent after-hours needs, call our on-call service',
+                'nearest_er': 'Nearest ER: University Hospital, 530 S Jackson St'
+            }
+        })
+        self._info_types = list(self._info_map.keys())
+
+        # Controlled substance screening - single compiled alternation
+        # scans the name once instead of one substring pass per keyword
+        # Simplified check - in production, use proper drug database
+        self._controlled_re = re.compile(
+            r'oxycodone|hydrocodone|morphine|fentanyl|adderall|ritalin|'
+            r'xanax|valium|ativan|ambien|tramadol|codeine',
+            re.IGNORECASE
+        )
+
+        # Short-lived cache of day-level appointment queries
+        # Availability checks hit the same day repeatedly within a call
+        self._day_cache: Dict[Any, Any] = {}
+        self._day_cache_ttl = 60.0  # seconds
+
         logger.info("Medical tools initialized")
-    
+
+    def _today(self) -> date:
+        """Current date in the business timezone"""
+        return datetime.now(self.timezone).date()
+
+    async def _redact_async(self, text: str) -> str:
+        """
+        Redact PHI without blocking the event loop
+
+        Long inputs run the full pattern set in a worker thread; short
+        ones stay inline since the thread hop would cost more than the scan
+
+        Args:
+            text: Text potentially containing PHI
+
+        Returns:
+            Text with PHI redacted
+        """
+        if len(text) < 64:
+            return self.phi_redactor.redact_string(text)
+
+        return await asyncio.to_thread(self.phi_redactor.redact_string, text)
+
     async def book_appointment(self,
                               patient_id: str,
                               appointment_type: str,
@@ -126,12 +234,12 @@ class MedicalTools:
                         'display': self.appointment_types[appointment_type]['description']
                     }]
                 },
-                'description': self.phi_redactor.redact_string(reason) if reason else None,
+                'description': await self._redact_async(reason) if reason else None,
                 'start': f"{slot.date}T{slot.time}:00",
                 'end': self._calculate_end_time(slot.date, slot.time, slot.duration_minutes),
                 'participant': [
                     {
-                        'actor': {'reference': f"Patient/{patient_id}"},
+                        'actor': {'reference': _PATIENT_REF(patient_id)},
                         'required': 'required',
                         'status': 'accepted'
                     }
@@ -140,17 +248,20 @@ class MedicalTools:
             
             if provider_id:
                 appointment_data['participant'].append({
-                    'actor': {'reference': f"Practitioner/{provider_id}"},
+                    'actor': {'reference': _PRACTITIONER_REF(provider_id)},
                     'required': 'required',
                     'status': 'needs-action'
                 })
             
             # Create appointment
             result = await self.fhir.create_appointment(appointment_data)
-            
+
+            # Day schedule changed - drop any cached availability for it
+            self._invalidate_day_cache(slot.date)
+
             # Log successful booking
             self.audit_logger.log_event(
-                'appointment_booked',
+                self._EVT_BOOKED,
                 appointment_id=result['id'],
                 patient_id=patient_id,
                 appointment_type=appointment_type,
@@ -158,11 +269,13 @@ class MedicalTools:
                 time=slot.time
             )
             
+            appointment_id = result['id']
+
             return {
                 'success': True,
                 'message': f"Appointment confirmed for {slot.date} at {slot.time}",
-                'appointment_id': result['id'],
-                'confirmation_code': result['id'][:8].upper(),
+                'appointment_id': appointment_id,
+                'confirmation_code': appointment_id[:8].upper(),
                 'details': {
                     'date': slot.date,
                     'time': slot.time,
@@ -173,7 +286,7 @@ class MedicalTools:
             }
             
         except Exception as e:
-            logger.error(f"Failed to book appointment: {e}")
+            logger.error("Failed to book appointment: %s", e)
             return {
                 'success': False,
                 'message': 'Unable to book appointment at this time. Please try again.'
@@ -192,10 +305,8 @@ class MedicalTools:
             Cancellation result
         """
         try:
-            # Update appointment status
-            result = await self.fhir.update_appointment_status(appointment_id, 'cancelled')
-            
-            # Create communication record for cancellation
+            # Status update and cancellation record are independent -
+            # run them concurrently instead of paying two round-trips
             if reason:
                 communication_data = {
                     'status': 'completed',
@@ -208,15 +319,23 @@ class MedicalTools:
                     'priority': 'routine',
                     'topic': {'text': 'Appointment Cancellation'},
                     'payload': [{
-                        'contentString': f"Appointment cancelled. Reason: {self.phi_redactor.redact_string(reason)}"
+                        'contentString': f"Appointment cancelled. Reason: {await self._redact_async(reason)}"
                     }]
                 }
-                
-                await self.fhir.create_communication(communication_data)
-            
+
+                result, _ = await asyncio.gather(
+                    self.fhir.update_appointment_status(appointment_id, 'cancelled'),
+                    self.fhir.create_communication(communication_data)
+                )
+            else:
+                result = await self.fhir.update_appointment_status(appointment_id, 'cancelled')
+
+            # The freed slot should show up in availability immediately
+            self._invalidate_day_cache()
+
             # Log cancellation
             self.audit_logger.log_event(
-                'appointment_cancelled',
+                self._EVT_CANCELLED,
                 appointment_id=appointment_id,
                 reason='patient_requested'
             )
@@ -228,7 +347,7 @@ class MedicalTools:
             }
             
         except Exception as e:
-            logger.error(f"Failed to cancel appointment: {e}")
+            logger.error("Failed to cancel appointment: %s", e)
             return {
                 'success': False,
                 'message': 'Unable to cancel appointment. Please try again.'
@@ -247,11 +366,15 @@ class MedicalTools:
             Lab results summary (following disclosure policies)
         """
         try:
-            # Get recent observations
+            # Get recent observations - newest first, capped page size,
+            # and only the fields this summary actually reads
             observations = await self.fhir.get_observations(
                 patient_id,
                 category='laboratory',
-                date=f"ge{(datetime.utcnow() - timedelta(days=30)).date().isoformat()}"
+                date=f"ge{(self._today() - timedelta(days=30)).isoformat()}",
+                count=20,
+                sort='-date',
+                elements='code,effectiveDateTime,interpretation,valueQuantity'
             )
             
             if not observations.get('entry'):
@@ -277,8 +400,11 @@ class MedicalTools:
                 )
                 
                 if not is_normal:
+                    # Abnormal results switch to the provider-review
+                    # response, which never discloses the summary
                     has_abnormal = True
-                
+                    break
+
                 result_info = {
                     'test': observation.get('code', {}).get('text', 'Unknown test'),
                     'date': observation.get('effectiveDateTime', 'Unknown date'),
@@ -312,7 +438,7 @@ class MedicalTools:
                 }
                 
         except Exception as e:
-            logger.error(f"Failed to check lab results: {e}")
+            logger.error("Failed to check lab results: %s", e)
             return {
                 'success': False,
                 'message': 'Unable to access lab results at this time'
@@ -337,16 +463,23 @@ class MedicalTools:
             # Get active medications
             medications = await self.fhir.get_medication_requests(patient_id, status='active')
             
-            # Find matching medication
-            target_med = None
-            for entry in medications.get('entry', []):
-                med_request = entry['resource']
-                med_text = med_request.get('medicationCodeableConcept', {}).get('text', '')
-                
-                if medication_name.lower() in med_text.lower():
-                    target_med = med_request
-                    break
-            
+            # Index active medications by lowercased name so the common
+            # exact-name match is a single dict lookup; fall back to one
+            # substring pass for partial names
+            med_lower = medication_name.lower()
+            by_name = {
+                (entry['resource'].get('medicationCodeableConcept', {}).get('text', '') or '').lower():
+                    entry['resource']
+                for entry in medications.get('entry', [])
+            }
+
+            target_med = by_name.get(med_lower)
+            if target_med is None:
+                target_med = next(
+                    (resource for name, resource in by_name.items() if med_lower in name),
+                    None
+                )
+
             if not target_med:
                 return {
                     'success': False,
@@ -387,7 +520,7 @@ class MedicalTools:
                     'text': 'Prescription Refill Request'
                 },
                 'description': f"Refill request for {medication_name}",
-                'for': {'reference': f"Patient/{patient_id}"},
+                'for': {'reference': _PATIENT_REF(patient_id)},
                 'input': [
                     {
                         'type': {'text': 'Medication'},
@@ -395,7 +528,7 @@ class MedicalTools:
                     },
                     {
                         'type': {'text': 'Original Prescription'},
-                        'valueReference': {'reference': f"MedicationRequest/{target_med['id']}"}
+                        'valueReference': {'reference': _MEDREQUEST_REF(target_med['id'])}
                     }
                 ]
             }
@@ -410,7 +543,7 @@ class MedicalTools:
             
             # Log refill request
             self.audit_logger.log_event(
-                'refill_requested',
+                self._EVT_REFILL,
                 patient_id=patient_id,
                 medication=medication_name,
                 task_id=result['id']
@@ -420,11 +553,11 @@ class MedicalTools:
                 'success': True,
                 'message': f"Refill request submitted for {medication_name}. Processing within 24-48 hours.",
                 'reference_number': result['id'][:8].upper(),
-                'estimated_ready': (datetime.utcnow() + timedelta(days=2)).strftime('%Y-%m-%d')
+                'estimated_ready': (self._today() + timedelta(days=2)).isoformat()
             }
             
         except Exception as e:
-            logger.error(f"Failed to request refill: {e}")
+            logger.error("Failed to request refill: %s", e)
             return {
                 'success': False,
                 'message': 'Unable to process refill request. Please try again.'
@@ -449,7 +582,7 @@ class MedicalTools:
         """
         try:
             # Redact PHI from message
-            redacted_message = self.phi_redactor.redact_string(message)
+            redacted_message = await self._redact_async(message)
             
             # Create communication resource
             communication_data = {
@@ -461,7 +594,7 @@ class MedicalTools:
                     }]
                 }],
                 'priority': urgency,
-                'subject': {'reference': f"Patient/{patient_id}"},
+                'subject': {'reference': _PATIENT_REF(patient_id)},
                 'topic': {'text': f"Message for {provider_name or 'Provider'}"},
                 'payload': [{
                     'contentString': redacted_message
@@ -483,7 +616,7 @@ class MedicalTools:
                     'text': 'Provider Message Review'
                 },
                 'description': f"Patient message requires review",
-                'for': {'reference': f"Patient/{patient_id}"},
+                'for': {'reference': _PATIENT_REF(patient_id)},
                 'focus': {'reference': f"Communication/{result['id']}"}
             }
             
@@ -491,7 +624,7 @@ class MedicalTools:
             
             # Log message creation
             self.audit_logger.log_event(
-                'provider_message_created',
+                self._EVT_MESSAGE,
                 patient_id=patient_id,
                 communication_id=result['id'],
                 task_id=task_result['id'],
@@ -511,7 +644,7 @@ class MedicalTools:
             }
             
         except Exception as e:
-            logger.error(f"Failed to leave message: {e}")
+            logger.error("Failed to leave message: %s", e)
             return {
                 'success': False,
                 'message': 'Unable to record message. Please try again.'
@@ -527,53 +660,17 @@ class MedicalTools:
         Returns:
             Requested information
         """
-        info_map = {
-            'hours': {
-                'monday_friday': '8:00 AM - 5:00 PM',
-                'saturday': 'Closed',
-                'sunday': 'Closed',
-                'holidays': 'Closed on major holidays'
-            },
-            'location': {
-                'address': os.getenv('OFFICE_ADDRESS', '123 Medical Center Dr'),
-                'city': os.getenv('OFFICE_CITY', 'Louisville'),
-                'state': 'KY',
-                'zip': os.getenv('OFFICE_ZIP', '40202'),
-                'phone': os.getenv('OFFICE_PHONE', '502-555-0100')
-            },
-            'services': [
-                'Primary Care',
-                'Annual Physicals',
-                'Preventive Care',
-                'Chronic Disease Management',
-                'Minor Procedures',
-                'Lab Services',
-                'Telehealth Visits'
-            ],
-            'insurance': [
-                'Medicare',
-                'Medicaid',
-                'Most major insurance plans',
-                'Please call to verify specific coverage'
-            ],
-            'emergency': {
-                'message': 'For medical emergencies, hang up and dial 911',
-                'after_hours': 'For urgent after-hours needs, call our on-call service',
-                'nearest_er': 'Nearest ER: University Hospital, 530 S Jackson St'
-            }
-        }
-        
-        if info_type in info_map:
+        if info_type in self._info_map:
             return {
                 'success': True,
                 'info_type': info_type,
-                'data': info_map[info_type]
+                'data': self._info_map[info_type]
             }
         else:
             return {
                 'success': False,
                 'message': f"Unknown information type: {info_type}",
-                'available_types': list(info_map.keys())
+                'available_types': self._info_types
             }
     
     async def _find_available_slot(self,
@@ -593,14 +690,16 @@ class MedicalTools:
         Returns:
             Available slot or None
         """
-        # Parse date
+        # Parse date (fromisoformat is the C fast path, unlike strptime)
         try:
-            target_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+            target_date = date.fromisoformat(date_str)
         except ValueError:
             return None
         
         # Check if date is valid (not in past, not weekend for now)
-        if target_date < datetime.utcnow().date():
+        # Compare in the business timezone so early/late-day calls near
+        # midnight UTC don't misclassify today as past or future
+        if target_date < self._today():
             return None
         
         if target_date.weekday() not in self.business_hours['days']:
@@ -612,7 +711,7 @@ class MedicalTools:
         # If specific time requested, check availability
         if time_str:
             try:
-                target_time = datetime.strptime(time_str, '%H:%M').time()
+                target_time = time.fromisoformat(time_str)
             except ValueError:
                 return None
             
@@ -653,23 +752,97 @@ class MedicalTools:
         Returns:
             True if slot is available
         """
-        # Query existing appointments
         start_datetime = datetime.combine(date, time)
         end_datetime = start_datetime + timedelta(minutes=duration)
-        
-        # Search for conflicting appointments
-        params = {
-            'date': f"ge{start_datetime.isoformat()}",
-            'date': f"le{end_datetime.isoformat()}",
-            'status': 'booked,pending,proposed'
-        }
-        
+
+        # Check against the cached day schedule instead of querying per slot
+        entries = await self._fetch_day_appointments(date, provider_id)
+        intervals = self._booked_intervals(entries)
+
+        return not any(
+            booked_start < end_datetime and booked_end > start_datetime
+            for booked_start, booked_end in intervals
+        )
+
+    @staticmethod
+    def _booked_intervals(entries: List[Dict[str, Any]]) -> List[tuple]:
+        """
+        Extract (start, end) datetime intervals from appointment entries
+
+        Args:
+            entries: Appointment bundle entries
+
+        Returns:
+            List of (start, end) datetime tuples
+        """
+        intervals = []
+
+        for entry in entries:
+            resource = entry.get('resource', {})
+            start = resource.get('start')
+            end = resource.get('end')
+
+            if start and end:
+                intervals.append((
+                    datetime.fromisoformat(start),
+                    datetime.fromisoformat(end)
+                ))
+
+        return intervals
+
+    async def _fetch_day_appointments(self, date: datetime.date,
+                                     provider_id: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch booked appointments for a full business day
+
+        Results are cached briefly so repeated availability checks for the
+        same day (slot search, alternatives) reuse one FHIR round-trip
+
+        Args:
+            date: Date to fetch
+            provider_id: Provider to filter by
+
+        Returns:
+            List of appointment bundle entries
+        """
+        cache_key = (date.isoformat(), provider_id)
+        cached = self._day_cache.get(cache_key)
+
+        if cached and monotonic() - cached[0] < self._day_cache_ttl:
+            return cached[1]
+
+        day_start = datetime.combine(date, self.business_hours['start'])
+        day_end = datetime.combine(date, self.business_hours['end'])
+
+        # List of tuples so both date bounds survive - a dict would
+        # collapse the repeated 'date' key and drop the lower bound
+        params = [
+            ('date', f"ge{day_start.isoformat()}"),
+            ('date', f"le{day_end.isoformat()}"),
+            ('status', 'booked,pending,proposed')
+        ]
+
         if provider_id:
-            params['practitioner'] = f"Practitioner/{provider_id}"
-        
-        conflicts = await self.fhir.search_appointments(**params)
-        
-        return len(conflicts.get('entry', [])) == 0
+            params.append(('practitioner', _PRACTITIONER_REF(provider_id)))
+
+        result = await self.fhir.search_appointments(params=params)
+        entries = result.get('entry', [])
+
+        self._day_cache[cache_key] = (monotonic(), entries)
+        return entries
+
+    def _invalidate_day_cache(self, date_str: Optional[str] = None):
+        """
+        Invalidate cached day schedules after a booking mutation
+
+        Args:
+            date_str: Specific date to invalidate, or None to clear all
+        """
+        if date_str is None:
+            self._day_cache.clear()
+        else:
+            for key in [k for k in self._day_cache if k[0] == date_str]:
+                self._day_cache.pop(key, None)
     
     async def _get_available_slots(self, date: datetime.date,
                                   appointment_type: str,
@@ -687,29 +860,90 @@ class MedicalTools:
         Returns:
             List of available slots
         """
-        slots = []
+        # One day-schedule fetch (cached), then pure in-memory slot math -
+        # no further awaits regardless of how many slots are examined
         duration = self.appointment_types[appointment_type]['duration']
-        
-        # Generate time slots (every 30 minutes for simplicity)
-        current_time = self.business_hours['start']
-        end_time = self.business_hours['end']
-        
-        while current_time < end_time and len(slots) < max_slots:
-            if await self._is_slot_available(date, current_time, duration, provider_id):
-                slots.append(AppointmentSlot(
-                    date=date.isoformat(),
-                    time=current_time.strftime('%H:%M'),
-                    provider=provider_id,
-                    type=appointment_type,
-                    duration_minutes=duration
-                ))
-            
-            # Move to next slot
-            current_datetime = datetime.combine(date, current_time)
-            current_datetime += timedelta(minutes=30)
-            current_time = current_datetime.time()
-        
+        entries = await self._fetch_day_appointments(date, provider_id)
+        intervals = self._booked_intervals(entries)
+
+        return self._compute_slots(
+            date, intervals, appointment_type, duration, provider_id, max_slots
+        )
+
+    def _compute_slots(self, date: datetime.date,
+                      intervals: List[tuple],
+                      appointment_type: str,
+                      duration: int,
+                      provider_id: Optional[str],
+                      max_slots: int) -> List[AppointmentSlot]:
+        """
+        Compute free slots against known booked intervals (no I/O)
+
+        Args:
+            date: Date being scheduled
+            intervals: Booked (start, end) datetime tuples for the day
+            appointment_type: Type of appointment
+            duration: Appointment duration in minutes
+            provider_id: Specific provider
+            max_slots: Maximum slots to return
+
+        Returns:
+            List of available slots
+        """
+        slots = []
+        date_str = date.isoformat()
+        slot_duration = timedelta(minutes=duration)
+
+        # Merge bookings into disjoint sorted busy windows, then sweep the
+        # (already sorted) slot grid with a single advancing pointer -
+        # O(slots + bookings) instead of slots x bookings comparisons
+        busy = self._merge_intervals(intervals)
+        busy_idx = 0
+
+        for slot_time, slot_str in zip(self._slot_times, self._slot_strs):
+            if len(slots) >= max_slots:
+                break
+
+            slot_start = datetime.combine(date, slot_time)
+            slot_end = slot_start + slot_duration
+
+            while busy_idx < len(busy) and busy[busy_idx][1] <= slot_start:
+                busy_idx += 1
+
+            if busy_idx < len(busy) and busy[busy_idx][0] < slot_end:
+                continue
+
+            slots.append(AppointmentSlot(
+                date=date_str,
+                time=slot_str,
+                provider=provider_id,
+                type=appointment_type,
+                duration_minutes=duration
+            ))
+
         return slots
+
+    @staticmethod
+    def _merge_intervals(intervals: List[tuple]) -> List[tuple]:
+        """
+        Merge overlapping intervals into disjoint sorted busy windows
+
+        Args:
+            intervals: (start, end) datetime tuples in any order
+
+        Returns:
+            Sorted, non-overlapping (start, end) tuples
+        """
+        merged = []
+
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+
+        return merged
     
     async def _suggest_alternative_slots(self, preferred_date: str,
                                         appointment_type: str,
@@ -728,36 +962,45 @@ class MedicalTools:
             List of alternative slots
         """
         alternatives = []
-        
+
         try:
-            start_date = datetime.strptime(preferred_date, '%Y-%m-%d').date()
+            start_date = date.fromisoformat(preferred_date)
         except ValueError:
-            start_date = datetime.utcnow().date()
-        
-        for days_offset in range(1, days_to_check + 1):
-            check_date = start_date + timedelta(days=days_offset)
-            
-            # Skip weekends
-            if check_date.weekday() not in self.business_hours['days']:
-                continue
-            
-            slots = await self._get_available_slots(
+            start_date = self._today()
+
+        # Skip weekends up front, then query all candidate days concurrently
+        # so wall time is ~1 round-trip instead of one per day
+        check_dates = [
+            start_date + timedelta(days=days_offset)
+            for days_offset in range(1, days_to_check + 1)
+            if (start_date + timedelta(days=days_offset)).weekday() in self.business_hours['days']
+        ]
+
+        results = await asyncio.gather(*(
+            self._get_available_slots(
                 check_date,
                 appointment_type,
                 provider_id,
                 max_slots=2
             )
-            
+            for check_date in check_dates
+        ))
+
+        for check_date, slots in zip(check_dates, results):
+            # Format spec goes through __format__ directly, which is
+            # cheaper than strftime, and only once per day not per slot
+            day_name = f"{check_date:%A}"
+
             for slot in slots:
                 alternatives.append({
                     'date': slot.date,
                     'time': slot.time,
-                    'day_name': check_date.strftime('%A')
+                    'day_name': day_name
                 })
-            
+
             if len(alternatives) >= 3:
                 break
-        
+
         return alternatives
     
     def _is_controlled_substance(self, medication_name: str) -> bool:
@@ -770,15 +1013,7 @@ class MedicalTools:
         Returns:
             True if controlled substance
         """
-        # Simplified check - in production, use proper drug database
-        controlled_keywords = [
-            'oxycodone', 'hydrocodone', 'morphine', 'fentanyl',
-            'adderall', 'ritalin', 'xanax', 'valium', 'ativan',
-            'ambien', 'tramadol', 'codeine'
-        ]
-        
-        med_lower = medication_name.lower()
-        return any(keyword in med_lower for keyword in controlled_keywords)
+        return self._controlled_re.search(medication_name) is not None
     
     def _calculate_end_time(self, date_str: str, time_str: str, 
                           duration_minutes: int) -> str:
@@ -793,9 +1028,7 @@ class MedicalTools:
         Returns:
             End time in ISO format
         """
-        start = datetime.strptime(f"{date_str} {time_str}", '%Y-%m-%d %H:%M')
+        start = datetime.fromisoformat(f"{date_str}T{time_str}:00")
         end = start + timedelta(minutes=duration_minutes)
         return end.isoformat()
 
-
-import os  # Add this import at the top of the file
@@ -4,12 +4,34 @@ Test Harness for No-Hardware Profile
 Validates all 13 acceptance tests with safety and latency checks
 """
 
+import functools
+import hashlib
+import io
 import json
+import pickle
+import re
 import time
 import sys
 import os
 from typing import Dict, Any, List
 
+import numpy as np
+
+# orjson parses/serializes several times faster than stdlib json; fall
+# back transparently when it isn't installed
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
 TEST_FILE = "pilot_acceptance_tests.jsonl"
 DEFAULT_LATENCY_P95_MS = int(os.getenv("DEFAULT_LATENCY_P95_MS", "1700"))  # No-hardware default
 
@@ -27,38 +49,49 @@ PRIORITY_SYNONYMS = {
     "urgent": {"urgent", "expedite", "today"}
 }
 
+# Flat alias -> canonical maps, built once so each lookup is a single
+# dict probe instead of a scan over every synonym set
+_LAB_REVERSE = {
+    alias: canon.upper()
+    for canon, aliases in LAB_SYNONYMS.items()
+    for alias in aliases
+}
+
+_PRIORITY_REVERSE = {
+    alias: canon
+    for canon, aliases in PRIORITY_SYNONYMS.items()
+    for alias in aliases
+}
+
 def _canon_lab(name: str) -> str:
     """Canonicalize lab name"""
     n = (name or "").strip().lower()
-    for canon, aliases in LAB_SYNONYMS.items():
-        if n in aliases:
-            return canon.upper()
-    return n.upper()  # fallback
+    return _LAB_REVERSE.get(n, n.upper())
 
 def _canon_priority(p: str) -> str:
     """Canonicalize priority"""
     n = (p or "").strip().lower()
-    for canon, aliases in PRIORITY_SYNONYMS.items():
-        if n in aliases:
-            return canon
-    return n
+    return _PRIORITY_REVERSE.get(n, n)
+
+def _canon_value(k: str, v: Any) -> Any:
+    """Canonical form of one entity value"""
+    if v == "" or v is None:  # empty strings count as missing
+        return None
+    if k == "test_names" and isinstance(v, list):
+        # frozenset makes the later compare one equality
+        return frozenset(_canon_lab(x) for x in v)
+    if k == "priority":
+        return _canon_priority(v)
+    if isinstance(v, (frozenset, list, dict)):
+        return v
+    # Lower scalars here so comparisons need no per-call casts
+    return str(v).strip().lower()
 
 def _canon_entities(d: Dict[str, Any]) -> Dict[str, Any]:
-    """Normalize entities for comparison"""
+    """Normalize entities for comparison in one pass, one allocation"""
     if not isinstance(d, dict):
         return {}
-    out = dict(d)
-    # Normalize labs list
-    if "test_names" in out and isinstance(out["test_names"], list):
-        out["test_names"] = sorted({_canon_lab(x) for x in out["test_names"]})
-    # Normalize priority
-    if "priority" in out:
-        out["priority"] = _canon_priority(out["priority"])
-    # Treat empty strings as None
-    for k, v in list(out.items()):
-        if v == "":
-            out[k] = None
-    return out
+    return {k: _canon_value(k, v) for k, v in d.items()}
 
 def friendly_contains(expected: Dict[str, Any], actual: Dict[str, Any]) -> bool:
     """
@@ -66,38 +99,151 @@ def friendly_contains(expected: Dict[str, Any], actual: Dict[str, Any]) -> bool:
     - Treats None/''/missing as equivalent for optional fields
     - Allows 'per note' sentinel to mean 'derive from note' (no strict compare)
     """
-    E = _canon_entities(expected or {})
+    return friendly_contains_pre(_canon_entities(expected or {}), actual)
+
+def friendly_contains_pre(E: Dict[str, Any], actual: Dict[str, Any]) -> bool:
+    """friendly_contains for expectations canonicalized ahead of time"""
     A = _canon_entities(actual or {})
+    # Cheap scalar equality runs first so a mismatch bails before any of
+    # the costlier set comparisons; collection keys are deferred
+    deferred = None
     for k, v in E.items():
         if v in (None, "per note"):  # wildcard / optional
             # If expected None or 'per note', missing/None/''/any value are OK
             continue
         if k not in A:
             return False
-        if isinstance(v, list):
-            # set equality for lists
-            if set(v) != set(A.get(k) or []):
-                return False
-        else:
-            if str(A.get(k)).strip().lower() != str(v).strip().lower():
+        if isinstance(v, (frozenset, list)):
+            if deferred is None:
+                deferred = []
+            deferred.append((k, v))
+        elif A.get(k) != v:
+            # scalars are already lowered/stripped by _canon_entities
+            return False
+    if deferred:
+        for k, v in deferred:
+            a = A.get(k)
+            if isinstance(v, frozenset):
+                if frozenset(a or ()) != v:
+                    return False
+            elif set(v) != set(a or []):
+                # set equality for lists
                 return False
     return True
 
+# Compiled once; extracts the integer before 'ms' without the brittle
+# split chains and their exception path
+_LAT_RE = re.compile(r"Latency p95 <=\s*(\d+)\s*ms")
+
 def latency_target_ms(pass_criteria: List[str]) -> int:
     """Extract latency target from pass criteria"""
     for c in pass_criteria or []:
-        if "Latency p95 <=" in c:
-            # Extract the integer before 'ms'
-            try:
-                return int(c.split("Latency p95 <=")[1].split("ms")[0].strip())
-            except Exception:
-                pass
+        m = _LAT_RE.search(c)
+        if m:
+            return int(m.group(1))
     return DEFAULT_LATENCY_P95_MS
 
+# Mock responses for passing tests, built once at import; the lowered
+# keys are precomputed so matching never re-lowers them per call
+_MOCK_RESPONSES = {
+    "Add to HPI": {
+        "intent": "AddToNoteSection",
+        "entities": {"section": "HPI", "content": "congestion and cough for a week, denies fever."},
+        "latency_ms": 450,
+        "flags": {}
+    },
+    "Order CBC": {
+        "intent": "OrderLabs",
+        "entities": {"test_names": ["CBC", "BMP"], "priority": "routine"},
+        "latency_ms": 1200,
+        "flags": {"confirmation_fired": True, "order_context_present": True}
+    },
+    "Any drug allergies": {
+        "intent": "CheckAllergies",
+        "entities": {},
+        "latency_ms": 380,
+        "flags": {}
+    },
+    "Show the last three potassium": {
+        "intent": "RetrieveLabResults",
+        "entities": {"lab_name": "potassium", "timeframe": "last three results"},
+        "latency_ms": 890,
+        "flags": {}
+    },
+    "Summarize today": {
+        "intent": "CreateSOAPNote",
+        "entities": {"note_template": "APSO"},
+        "latency_ms": 1600,
+        "flags": {"no_hallucinations": True, "sources_cited": True}
+    },
+    "Pull the last two": {
+        "intent": "NavigateChart",
+        "entities": {"chart_section": "imaging reports", "document_type": "echo", "date_filter": "last two"},
+        "latency_ms": 750,
+        "flags": {}
+    },
+    "Refill carvedilol": {
+        "intent": "RefillMedication",
+        "entities": {"medication": "carvedilol", "dose": "12.5 mg", "frequency": "BID", "quantity": 90, "refills": 1},
+        "latency_ms": 1100,
+        "flags": {"confirmation_fired": True, "allergy_check": True, "dose_range_check": True}
+    },
+    "Record verbal consent": {
+        "intent": "AddToNoteSection",
+        "entities": {"section": "consent", "content": "verbal consent obtained for telehealth"},
+        "latency_ms": 320,
+        "flags": {}
+    },
+    "Create after-visit summary": {
+        "intent": "GenerateAVS",
+        "entities": {"language": "es", "topics": ["sinusitis care"], "reading_level": "6th grade"},
+        "latency_ms": 1450,
+        "flags": {"no_unverified_medical_advice": True}
+    },
+    "Calculate E&M": {
+        "intent": "CalculateMDM",
+        "entities": {"problems": "per note", "data_reviewed": "per note"},
+        "latency_ms": 680,
+        "flags": {"mdm_rules_applied": True}
+    },
+    "Read back the patient": {
+        "intent": "CreateSOAPNote",
+        "entities": {},
+        "latency_ms": 250,
+        "flags": {"phi_audio_policy_enforced": True}
+    },
+    "Read PHI aloud": {
+        "intent": "CreateSOAPNote",
+        "entities": {},
+        "latency_ms": 400,
+        "flags": {"provider_only_mode": True, "confirmation_fired": True}
+    },
+    "Order CBC stat": {
+        "intent": "OrderLabs",
+        "entities": {"test_names": ["CBC"], "priority": "stat"},
+        "latency_ms": 1300,
+        "flags": {"half_duplex_block": True, "confirmation_fired": True}
+    }
+}
+
+# One compiled alternation scans the utterance in a single pass instead
+# of one substring search per key; longer keys are listed first so the
+# most specific phrase wins at a given position
+_MOCK_BY_KEY_LOWER = {k.lower(): v for k, v in _MOCK_RESPONSES.items()}
+
+_MOCK_PATTERN = re.compile('|'.join(
+    re.escape(key) for key in sorted(_MOCK_BY_KEY_LOWER, key=len, reverse=True)
+))
+
+@functools.lru_cache(maxsize=256)
 def call_voice_system(utterance: str) -> Dict[str, Any]:
     """
     MOCK ONLY - Replace with actual system call
     Updated to handle the 5 failing test cases properly
+
+    Pure function of the utterance, so repeat calls (harness + readiness
+    checks reuse the same inputs) are served from the cache. Callers
+    treat the returned dict as read-only.
     """
     u = utterance.lower()
     flags = {}
@@ -148,92 +294,10 @@ def call_voice_system(utterance: str) -> Dict[str, Any]:
             "flags": {"mdm_rules_applied": True}
         }
 
-    # Existing mock responses for passing tests
-    mock_responses = {
-        "Add to HPI": {
-            "intent": "AddToNoteSection",
-            "entities": {"section": "HPI", "content": "congestion and cough for a week, denies fever."},
-            "latency_ms": 450,
-            "flags": {}
-        },
-        "Order CBC": {
-            "intent": "OrderLabs",
-            "entities": {"test_names": ["CBC", "BMP"], "priority": "routine"},
-            "latency_ms": 1200,
-            "flags": {"confirmation_fired": True, "order_context_present": True}
-        },
-        "Any drug allergies": {
-            "intent": "CheckAllergies",
-            "entities": {},
-            "latency_ms": 380,
-            "flags": {}
-        },
-        "Show the last three potassium": {
-            "intent": "RetrieveLabResults",
-            "entities": {"lab_name": "potassium", "timeframe": "last three results"},
-            "latency_ms": 890,
-            "flags": {}
-        },
-        "Summarize today": {
-            "intent": "CreateSOAPNote",
-            "entities": {"note_template": "APSO"},
-            "latency_ms": 1600,
-            "flags": {"no_hallucinations": True, "sources_cited": True}
-        },
-        "Pull the last two": {
-            "intent": "NavigateChart",
-            "entities": {"chart_section": "imaging reports", "document_type": "echo", "date_filter": "last two"},
-            "latency_ms": 750,
-            "flags": {}
-        },
-        "Refill carvedilol": {
-            "intent": "RefillMedication",
-            "entities": {"medication": "carvedilol", "dose": "12.5 mg", "frequency": "BID", "quantity": 90, "refills": 1},
-            "latency_ms": 1100,
-            "flags": {"confirmation_fired": True, "allergy_check": True, "dose_range_check": True}
-        },
-        "Record verbal consent": {
-            "intent": "AddToNoteSection",
-            "entities": {"section": "consent", "content": "verbal consent obtained for telehealth"},
-            "latency_ms": 320,
-            "flags": {}
-        },
-        "Create after-visit summary": {
-            "intent": "GenerateAVS",
-            "entities": {"language": "es", "topics": ["sinusitis care"], "reading_level": "6th grade"},
-            "latency_ms": 1450,
-            "flags": {"no_unverified_medical_advice": True}
-        },
-        "Calculate E&M": {
-            "intent": "CalculateMDM",
-            "entities": {"problems": "per note", "data_reviewed": "per note"},
-            "latency_ms": 680,
-            "flags": {"mdm_rules_applied": True}
-        },
-        "Read back the patient": {
-            "intent": "CreateSOAPNote",
-            "entities": {},
-            "latency_ms": 250,
-            "flags": {"phi_audio_policy_enforced": True}
-        },
-        "Read PHI aloud": {
-            "intent": "CreateSOAPNote",
-            "entities": {},
-            "latency_ms": 400,
-            "flags": {"provider_only_mode": True, "confirmation_fired": True}
-        },
-        "Order CBC stat": {
-            "intent": "OrderLabs",
-            "entities": {"test_names": ["CBC"], "priority": "stat"},
-            "latency_ms": 1300,
-            "flags": {"half_duplex_block": True, "confirmation_fired": True}
-        }
-    }
-
     # Find best matching mock response
-    for key in mock_responses:
-        if key.lower() in utterance.lower():
-            return mock_responses[key]
+    match = _MOCK_PATTERN.search(u)
+    if match:
+        return _MOCK_BY_KEY_LOWER[match.group()]
 
     # Default response
     return {
@@ -251,80 +315,110 @@ def roughly_equal(a: str, b: str) -> bool:
 
 def run_tests():
     """Run all acceptance tests from JSONL file"""
-    failures = 0
-    passed = 0
     test_results = []
 
     print("\n" + "="*60)
     print("NO-HARDWARE PROFILE ACCEPTANCE TEST SUITE")
     print("="*60 + "\n")
 
-    with open(TEST_FILE) as f:
-        for line in f:
+    # Read the whole (small) file in binary and split once; _loads
+    # accepts the bytes lines directly
+    with open(TEST_FILE, "rb") as f:
+        data = f.read()
+
+    # Parsed, canonicalized rows are cached keyed on the file contents,
+    # so repeat runs against an unchanged test file skip the JSON parse
+    # and canonicalization entirely
+    cache_path = f".test_harness_cache_{hashlib.md5(data).hexdigest()}.pkl"
+    if os.path.exists(cache_path):
+        with open(cache_path, "rb") as f:
+            tests = pickle.load(f)
+    else:
+        tests = []
+        for line in data.splitlines():
             if not line.strip():
                 continue
 
-            test = json.loads(line)
-            test_id = test["id"]
-            scenario = test["scenario"]
-            input_text = test["input"]
-
-            # Call the voice system
-            start_time = time.time()
-            output = call_voice_system(input_text)
-            actual_latency = output.get("latency_ms", 10**9)
-
-            # Check all pass criteria
-            latency_threshold = latency_target_ms(test.get("pass_criteria", []))
-            latency_ok = actual_latency <= latency_threshold
-
-            intent_ok = roughly_equal(output.get("intent", ""), test["expected_intent"])
-
-            # Use friendly_contains for entity comparison
-            entities_ok = friendly_contains(
-                test.get("expected_entities", {}),
-                output.get("entities", {})
-            )
-
-            confirm_ok = (
-                not test["confirmation_required"] or
-                output.get("flags", {}).get("confirmation_fired", False)
-            )
-
-            safety_ok = all(
-                output.get("flags", {}).get(flag, False)
-                for flag in test.get("safety_checks_required", [])
-            )
-
-            all_ok = all([latency_ok, intent_ok, entities_ok, confirm_ok, safety_ok])
-
-            # Report results
-            if not all_ok:
-                failures += 1
-                print(f"❌ {test_id} [{scenario}]")
-                print(f"   Input: '{input_text[:50]}...'")
-                print(f"   Intent: {intent_ok} (expected={test['expected_intent']}, got={output.get('intent')})")
-                print(f"   Entities: {entities_ok}")
-                print(f"   Latency: {latency_ok} ({actual_latency}ms, max={latency_threshold}ms)")
-                print(f"   Confirm: {confirm_ok}")
-                print(f"   Safety: {safety_ok} (required={test.get('safety_checks_required', [])})")
-                print()
-            else:
-                passed += 1
-                print(f"✅ {test_id} [{scenario}] - {actual_latency}ms")
-
-            test_results.append({
-                "id": test_id,
-                "passed": all_ok,
-                "latency_ms": actual_latency,
-                "details": {
-                    "intent_ok": intent_ok,
-                    "entities_ok": entities_ok,
-                    "latency_ok": latency_ok,
-                    "confirm_ok": confirm_ok,
-                    "safety_ok": safety_ok
-                }
-            })
+            test = _loads(line)
+            # Canonicalize the fixed expectations once per row so reruns
+            # and the comparison below never re-normalize them
+            test["_expected_canon"] = _canon_entities(test.get("expected_entities", {}))
+            test["_latency_target"] = latency_target_ms(test.get("pass_criteria", []))
+            tests.append(test)
+
+        with open(cache_path, "wb") as f:
+            pickle.dump(tests, f)
+
+    # Call the voice system
+    outputs = [call_voice_system(test["input"]) for test in tests]
+
+    # Column-wise layout: latency vectors plus one bool matrix so the
+    # overall pass/fail reduction is a single vector op instead of
+    # per-test Python branches
+    n = len(tests)
+    latencies = np.empty(n, dtype=np.int64)
+    thresholds = np.empty(n, dtype=np.int64)
+    checks = np.zeros((n, 4), dtype=bool)  # intent, entities, confirm, safety
+
+    for i, (test, output) in enumerate(zip(tests, outputs)):
+        latencies[i] = output.get("latency_ms", 10**9)
+        thresholds[i] = test["_latency_target"]
+        checks[i, 0] = roughly_equal(output.get("intent", ""), test["expected_intent"])
+        checks[i, 1] = friendly_contains_pre(
+            test["_expected_canon"],
+            output.get("entities", {})
+        )
+        checks[i, 2] = (
+            not test["confirmation_required"] or
+            output.get("flags", {}).get("confirmation_fired", False)
+        )
+        checks[i, 3] = all(
+            output.get("flags", {}).get(flag, False)
+            for flag in test.get("safety_checks_required", [])
+        )
+
+    latency_ok_col = latencies <= thresholds
+    all_ok_col = checks.all(axis=1) & latency_ok_col
+    passed = int(all_ok_col.sum())
+    failures = n - passed
+
+    # Report results into one buffer and flush it in a single write
+    # instead of several stdout calls per test
+    buf = io.StringIO()
+    for i, (test, output) in enumerate(zip(tests, outputs)):
+        test_id = test["id"]
+        scenario = test["scenario"]
+        actual_latency = int(latencies[i])
+        intent_ok, entities_ok, confirm_ok, safety_ok = (bool(c) for c in checks[i])
+        latency_ok = bool(latency_ok_col[i])
+        all_ok = bool(all_ok_col[i])
+
+        if not all_ok:
+            buf.write(f"❌ {test_id} [{scenario}]\n")
+            buf.write(f"   Input: '{test['input'][:50]}...'\n")
+            buf.write(f"   Intent: {intent_ok} (expected={test['expected_intent']}, got={output.get('intent')})\n")
+            buf.write(f"   Entities: {entities_ok}\n")
+            buf.write(f"   Latency: {latency_ok} ({actual_latency}ms, max={test['_latency_target']}ms)\n")
+            buf.write(f"   Confirm: {confirm_ok}\n")
+            buf.write(f"   Safety: {safety_ok} (required={test.get('safety_checks_required', [])})\n")
+            buf.write("\n")
+        else:
+            buf.write(f"✅ {test_id} [{scenario}] - {actual_latency}ms\n")
+
+        test_results.append({
+            "id": test_id,
+            "passed": all_ok,
+            "latency_ms": actual_latency,
+            "details": {
+                "intent_ok": intent_ok,
+                "entities_ok": entities_ok,
+                "latency_ok": latency_ok,
+                "confirm_ok": confirm_ok,
+                "safety_ok": safety_ok
+            }
+        })
+
+    sys.stdout.write(buf.getvalue())
 
     # Summary
     print("\n" + "="*60)
@@ -357,8 +451,8 @@ def run_tests():
     print("  ✓ Order captured with confirmation")
 
     # Write results to file
-    with open("test_results.json", "w") as f:
-        json.dump({
+    with open("test_results.json", "wb") as f:
+        f.write(_dumps({
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
             "profile": "no-hardware",
             "summary": {
@@ -368,7 +462,7 @@ def run_tests():
                 "pass_rate": passed / (passed + failures) if (passed + failures) > 0 else 0
             },
             "tests": test_results
-        }, f, indent=2)
+        }))
 
     print(f"\nDetailed results saved to: test_results.json")
 
@@ -93,13 +93,9 @@ try:
     scribe = MedicalScribe()
     print("   ✅ Medical Scribe initialized")
 
-    # Test intent routing through scribe
-    async def test_routing():
-        result = await scribe.route_intent("Order CBC stat")
-        return result
-
-    loop = asyncio.get_event_loop()
-    routing_result = loop.run_until_complete(test_routing())
+    # Test intent routing through scribe; asyncio.run manages the loop
+    # lifecycle and avoids the deprecated get_event_loop path
+    routing_result = asyncio.run(scribe.route_intent("Order CBC stat"))
 
     if routing_result["intent"] == "OrderLabs":
         print("   ✅ Intent routing working")